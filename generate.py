@@ -1,81 +1,290 @@
 #!/usr/bin/env python3
-from typing import List, Dict, Set, Optional, Any, Tuple, Iterator
+from typing import List, Dict, Set, FrozenSet, Optional, Any, Tuple, Iterator, Callable
 import os
 import re
 import json
 import yaml
 import argparse
+import functools
+import mmap
 import pathspec
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+_JSONC_SPECIAL_RE = re.compile(r'["/]')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+_INPUT_ID_RE = re.compile(r"\$\{input:([^}]+)\}")
+_DOCKER_DIR_RE = re.compile(
+    rb'(?im)^[ \t]*(FROM|EXPOSE)[ \t]+([^\r\n#]+)')
+_NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+
+_TABLE_OPEN = "<table style='border-collapse: collapse;'>"
+_TABLE_CLOSE = "</table>"
+_TR_OPEN, _TR_CLOSE = "<tr>", "</tr>"
+_TH = "<th style='border: 1px solid #ddd; padding:4px;'>%s</th>"
+_TD = "<td style='border: 1px solid #ddd; padding:4px;'>%s</td>"
+
+_README_START_MARKER = "<!-- README_DEVINFO:START -->"
+_README_END_MARKER = "<!-- README_DEVINFO:END -->"
+_README_SECTION_RE = re.compile(
+    f"{re.escape(_README_START_MARKER)}.*?{re.escape(_README_END_MARKER)}", re.DOTALL)
+
+
+_SEP = os.sep
+_SEPS = (os.sep, os.altsep) if os.altsep else (os.sep,)
+
+# Reports the verdict of the last pattern in one .gitignore that matches a
+# path: True to ignore it, False to re-include it (a "!" pattern), or None
+# when no pattern matches.
+IgnoreMatcher = Callable[[str], Optional[bool]]
+
+
+def _last_match_checker(spec: pathspec.PathSpec) -> IgnoreMatcher:
+    checks = [(pattern.regex.search, pattern.include)
+              for pattern in reversed(spec.patterns) if pattern.include is not None]
+
+    def check(path: str) -> Optional[bool]:
+        for search, include in checks:
+            if search(path):
+                return include
+        return None
+    return check
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_spec(content: str) -> Optional[IgnoreMatcher]:
+    # Fold all patterns of a .gitignore into one regex so a lookup is a single
+    # search call rather than testing each pattern in turn. Cached by
+    # contents, so identical .gitignore files compile once.
+    spec = pathspec.PathSpec.from_lines('gitwildmatch', content.splitlines())
+    regexes = []
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue
+        if not pattern.include:
+            # Negations depend on pattern order, which an alternation can't
+            # express, so check these files pattern by pattern.
+            return _last_match_checker(spec)
+        # Named groups repeat across patterns, which an alternation rejects;
+        # matching doesn't use them, so turn them into plain groups.
+        regexes.append(_NAMED_GROUP_RE.sub("(?:", pattern.regex.pattern))
+    if not regexes:
+        return None
+    try:
+        combined = re.compile("|".join(f"(?:{regex})" for regex in regexes))
+    except re.error:
+        return _last_match_checker(spec)
+    # Some patterns (e.g. "*/") compile without a "^" anchor, so search like
+    # pathspec does rather than match.
+    search = combined.search
 
+    def check(path: str) -> Optional[bool]:
+        return True if search(path) else None
+    return check
 
-def load_global_gitignore(base_dir: str) -> Optional[pathspec.PathSpec]:
+
+def load_global_gitignore(base_dir: str) -> Optional[IgnoreMatcher]:
     gitignore_path = os.path.join(base_dir, '.gitignore')
     if os.path.exists(gitignore_path) and pathspec:
         with open(gitignore_path, 'r', encoding='utf-8') as f:
-            patterns = f.read().splitlines()
-        return pathspec.PathSpec.from_lines('gitwildmatch', patterns)
+            return _compile_spec(f.read())
     return None
 
 
-def walk_with_gitignore(base_dir: str, global_spec: Optional[pathspec.PathSpec] = None) -> Iterator[Tuple[str, List[str], List[str]]]:
-    for root, dirs, files in os.walk(base_dir, topdown=True):
-        rel_root = os.path.relpath(root, base_dir)
-        if global_spec and rel_root != "." and global_spec.match_file(rel_root):
-            dirs[:] = []
-            files[:] = []
-            continue
-
-        # Load local .gitignore (if present) and filter children accordingly.
-        local_spec = None
-        local_gitignore = os.path.join(root, ".gitignore")
-        if os.path.exists(local_gitignore) and pathspec:
+def _scan(root: str) -> Tuple[List[os.DirEntry], List[os.DirEntry], bool]:
+    # One directory listing per visited directory; DirEntry caches the file
+    # type from readdir, so classifying entries and probing for .gitignore
+    # needs no extra stat calls.
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return [], [], False
+    dir_entries = []
+    file_entries = []
+    has_gitignore = False
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            dir_entries.append(entry)
+        else:
+            file_entries.append(entry)
+            if entry.name == ".gitignore" and entry.is_file(follow_symlinks=False):
+                has_gitignore = True
+    return dir_entries, file_entries, has_gitignore
+
+
+def _is_ignored(matchers: List[Tuple[IgnoreMatcher, str]], name: str) -> bool:
+    # Like git, the deepest .gitignore with an opinion on the path decides,
+    # so a local "!pattern" overrides a rule from a parent directory.
+    for matcher, prefix in reversed(matchers):
+        result = matcher(prefix + name)
+        if result is not None:
+            return result
+    return False
+
+
+def walk_with_gitignore(base_dir: str, global_spec: Optional[IgnoreMatcher] = None) -> Iterator[Tuple[str, List[str], List[str]]]:
+    # Each stack item carries the ignore matchers in effect for that
+    # directory as (matcher, prefix) pairs, where prefix is the directory's
+    # path relative to the matcher's .gitignore ("" for its own directory).
+    # gitignore rules apply to the whole subtree below the file, so the
+    # pairs are inherited by every subdirectory.
+    initial = [(global_spec, "")] if global_spec else []
+    stack = [(base_dir, initial)]
+    while stack:
+        root, matchers = stack.pop()
+        dir_entries, file_entries, has_gitignore = _scan(root)
+
+        # Load local .gitignore (if present); it applies from here down.
+        if has_gitignore and pathspec:
+            local_gitignore = os.path.join(root, ".gitignore")
             try:
                 with open(local_gitignore, 'r', encoding='utf-8') as f:
-                    patterns = f.read().splitlines()
-                if patterns:
-                    local_spec = pathspec.PathSpec.from_lines(
-                        'gitwildmatch', patterns)
+                    local_spec = _compile_spec(f.read())
+                # Matchers are cached by content, so the base directory's
+                # .gitignore is recognised as the global spec and not added
+                # twice.
+                if local_spec and (local_spec, "") not in matchers:
+                    matchers = matchers + [(local_spec, "")]
             except Exception as e:
                 print(f"Error processing {local_gitignore}: {e}")
-        if local_spec:
-            dirs[:] = [d for d in dirs if not local_spec.match_file(d)]
-            files = [f for f in files if not local_spec.match_file(f)]
+
+        # Prune ignored subdirectories so the walk never descends into them.
+        # The trailing slash makes gitwildmatch treat the path as a
+        # directory, so patterns like "build/" match.
+        dirs = [e.name for e in dir_entries]
+        files = [e.name for e in file_entries]
+        if matchers:
+            dirs = [d for d in dirs if not _is_ignored(matchers, d + "/")]
+            files = [f for f in files if not _is_ignored(matchers, f)]
         yield root, dirs, files
 
+        # Like os.walk(topdown=True), honour in-place edits to dirs made by
+        # the caller, and don't follow symlinked directories. Push in reverse
+        # so subdirectories are visited in listing order.
+        keep = set(dirs)
+        for entry in reversed(dir_entries):
+            if entry.name in keep and not entry.is_symlink():
+                child_matchers = [(matcher, prefix + entry.name + "/")
+                                  for matcher, prefix in matchers]
+                stack.append((entry.path, child_matchers))
 
-def find_files(base_dir: str, filename_regex: str, global_spec: Optional[pathspec.PathSpec] = None) -> List[str]:
-    matches = []
-    pattern = re.compile(filename_regex)
-    for root, dirs, files in walk_with_gitignore(base_dir, global_spec):
-        for file in files:
-            if pattern.fullmatch(file):
-                matches.append(os.path.join(root, file))
-    return matches
 
+def _dir_prefix(root: str) -> str:
+    # Joining with plain concatenation is equivalent to os.path.join for the
+    # walker's roots, which only end in a separator at a filesystem root.
+    return root if root.endswith(_SEPS) else root + _SEP
 
-def remove_json_comments(text: str) -> str:
-    pattern = r'("(?:\\.|[^"\\])*")|(/\*.*?\*/|//.*?$)'
 
-    def replacer(match):
-        if match.group(1) is not None:
-            return match.group(1)
-        return ""
-    return re.sub(pattern, replacer, text, flags=re.MULTILINE | re.DOTALL)
+_CONFIG_FILENAMES = {
+    "tasks.json": "tasks",
+    "launch.json": "launch",
+    "devcontainer.json": "devcontainer",
+    "Dockerfile": "dockerfile",
+}
+
+
+def collect_configs(base_dir: str, global_spec: Optional[IgnoreMatcher] = None) -> Dict[str, List[str]]:
+    # One walk for every config type, bucketing files by exact name.
+    configs: Dict[str, List[str]] = {
+        kind: [] for kind in _CONFIG_FILENAMES.values()}
+    for root, dirs, files in walk_with_gitignore(base_dir, global_spec):
+        prefix = _dir_prefix(root)
+        for file in files:
+            kind = _CONFIG_FILENAMES.get(file)
+            if kind:
+                configs[kind].append(prefix + file)
+    return configs
+
+
+def _strip_jsonc(text: str) -> str:
+    # Single forward pass over the text: jump between quote and slash
+    # characters with the C-level search/find methods, skip over string
+    # literals (honouring backslash escapes) and drop // and /* */ comments.
+    # Line comments keep their trailing newline so line numbers are preserved.
+    parts = []
+    search = _JSONC_SPECIAL_RE.search
+    find = text.find
+    length = len(text)
+    start = pos = 0
+    while True:
+        match = search(text, pos)
+        if not match:
+            break
+        i = match.start()
+        if text[i] == '"':
+            end = i + 1
+            while True:
+                end = find('"', end)
+                if end == -1:
+                    # Unterminated string: like the regex, treat the quote
+                    # as a plain character and keep scanning.
+                    end = i
+                    break
+                backslash = end - 1
+                while text[backslash] == "\\":
+                    backslash -= 1
+                if (end - 1 - backslash) % 2 == 0:
+                    break
+                end += 1
+            pos = end + 1
+        elif text.startswith("//", i):
+            parts.append(text[start:i])
+            end = find("\n", i)
+            start = pos = length if end == -1 else end
+        elif text.startswith("/*", i):
+            end = find("*/", i + 2)
+            if end == -1:
+                pos = i + 1
+                continue
+            parts.append(text[start:i])
+            start = pos = end + 2
+        else:
+            pos = i + 1
+    parts.append(text[start:])
+    return "".join(parts)
 
 
 def remove_trailing_commas(text: str) -> str:
-    return re.sub(r',\s*([}\]])', r'\1', text)
+    return _TRAILING_COMMA_RE.sub(r'\1', text)
 
 
 def parse_json_file(file_path: str) -> Optional[Dict[str, Any]]:
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError as e:
+        print(f"Error reading {file_path}: {e}")
+        return None
+    return _parse_json_cached(file_path, mtime)
+
+
+# Keyed by (path, mtime) so each file is parsed at most once until it changes.
+# Callers must treat the returned data as read-only since it is shared.
+@functools.lru_cache(maxsize=256)
+def _parse_json_cached(file_path: str, mtime: int) -> Optional[Dict[str, Any]]:
+    # Read the file once; the JSONC cleanup retry reuses the same buffer.
+    try:
+        with open(file_path, 'rb') as f:
+            buf = f.read()
+        if orjson:
+            return orjson.loads(buf)
+        return json.loads(buf)
     except json.JSONDecodeError:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            text = remove_json_comments(text)
+            text = _strip_jsonc(buf.decode('utf-8'))
             text = remove_trailing_commas(text)
             return json.loads(text)
         except Exception as inner_e:
@@ -89,7 +298,7 @@ def parse_json_file(file_path: str) -> Optional[Dict[str, Any]]:
 def parse_yaml_file(file_path: str) -> Optional[Dict[str, Any]]:
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YLoader)
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
@@ -98,23 +307,25 @@ def parse_yaml_file(file_path: str) -> Optional[Dict[str, Any]]:
 def generate_html_table(headers: List[str], rows: List[List[str]]) -> str:
     if not rows:
         return ""
-    num_cols = len(headers)
-    non_empty_cols = []
-    for col_index in range(num_cols):
-        if any(row[col_index].strip() for row in rows):
-            non_empty_cols.append(col_index)
-    new_headers = [headers[i] for i in non_empty_cols]
-    new_rows = [[row[i] for i in non_empty_cols] for row in rows]
-    table = "<table style='border-collapse: collapse;'>"
-    table += "<tr>" + \
-        "".join(
-            f"<th style='border: 1px solid #ddd; padding:4px;'>{h}</th>" for h in new_headers) + "</tr>"
+    # Transpose once so every cell is visited a single time.
+    cols = list(zip(*rows))
+    non_empty_cols = [i for i, col in enumerate(cols)
+                      if any(cell.strip() for cell in col)]
+    if len(non_empty_cols) == len(headers):
+        new_headers = headers
+        new_rows = rows
+    else:
+        new_headers = [headers[i] for i in non_empty_cols]
+        new_rows = [[row[i] for i in non_empty_cols] for row in rows]
+    parts = [_TABLE_OPEN, _TR_OPEN]
+    parts.extend([_TH % h for h in new_headers])
+    parts.append(_TR_CLOSE)
     for row in new_rows:
-        table += "<tr>" + \
-            "".join(
-                f"<td style='border: 1px solid #ddd; padding:4px;'>{cell}</td>" for cell in row) + "</tr>"
-    table += "</table>"
-    return table
+        parts.append(_TR_OPEN)
+        parts.extend([_TD % cell for cell in row])
+        parts.append(_TR_CLOSE)
+    parts.append(_TABLE_CLOSE)
+    return "".join(parts)
 
 
 def format_devcontainer_extensions(extensions_list: Optional[List[str]]) -> str:
@@ -158,6 +369,15 @@ def format_inputs_table(input_ids: Set[str], input_definitions: Dict[str, Dict[s
     return generate_html_table(["Name", "Description", "Options"], rows) if rows else ""
 
 
+def _cached_inputs_table(input_definitions: Dict[str, Dict[str, Any]]) -> Callable[[FrozenSet[str]], str]:
+    # Entries in one file often reference the same inputs; build each
+    # distinct table once per file instead of re-sorting and re-rendering it.
+    @functools.lru_cache(maxsize=64)
+    def inputs_table(input_ids: FrozenSet[str]) -> str:
+        return format_inputs_table(input_ids, input_definitions)
+    return inputs_table
+
+
 def format_volumes_table(volumes_list: List[str]) -> str:
     def format_host(host: str) -> str:
         if (host == "."):
@@ -182,15 +402,22 @@ def format_env_table(env_filtered: Dict[str, str]) -> str:
 
 
 def extract_all_input_ids(obj: Any) -> Set[str]:
-    found = set()
-    if isinstance(obj, dict):
-        for value in obj.values():
-            found.update(extract_all_input_ids(value))
-    elif isinstance(obj, list):
-        for item in obj:
-            found.update(extract_all_input_ids(item))
-    elif isinstance(obj, str):
-        found.update(re.findall(r"\$\{input:([^}]+)\}", obj))
+    # Iterative walk with a single result set; parsed JSON only contains
+    # plain dicts, lists and scalars, so exact type checks are enough.
+    found: Set[str] = set()
+    add = found.add
+    finditer = _INPUT_ID_RE.finditer
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            stack.extend(item.values())
+        elif item_type is list:
+            stack.extend(item)
+        elif item_type is str:
+            for match in finditer(item):
+                add(match.group(1))
     return found
 
 
@@ -207,6 +434,7 @@ def parse_vscode_tasks(file_path: str) -> List[Dict[str, str]]:
         tasks = data.get("tasks", [])
     else:
         tasks = data
+    inputs_table = _cached_inputs_table(input_definitions)
     for task in tasks:
         label = task.get("label", "")
         detail = task.get("detail", "")
@@ -214,8 +442,8 @@ def parse_vscode_tasks(file_path: str) -> List[Dict[str, str]]:
         if command:
             command = f'`{os.path.basename(command)}`'
         input_ids = extract_all_input_ids(task)
-        input_details = format_inputs_table(
-            input_ids, input_definitions) if input_ids else ""
+        input_details = inputs_table(
+            frozenset(input_ids)) if input_ids else ""
         tasks_info.append({
             "label": label,
             "detail": detail,
@@ -240,12 +468,13 @@ def parse_vscode_launch(file_path: str) -> List[Dict[str, str]]:
         configurations = data.get("configurations", [])
     else:
         configurations = data
+    inputs_table = _cached_inputs_table(input_definitions)
     for config in configurations:
         name = config.get("name", "")
         type_ = config.get("type", "")
         input_ids = extract_all_input_ids(config)
-        input_details = format_inputs_table(
-            input_ids, input_definitions) if input_ids else ""
+        input_details = inputs_table(
+            frozenset(input_ids)) if input_ids else ""
         launch_info.append({
             "name": name,
             "type": type_,
@@ -259,13 +488,17 @@ def parse_devcontainer(file_path: str) -> Dict[str, str]:
     dev_info: Dict[str, Any] = {}
     if not data:
         return dev_info
+    extensions = []
     customizations = data.get("customizations", {})
     if isinstance(customizations, dict):
         vscode_custom = customizations.get("vscode", {})
         if isinstance(vscode_custom, dict):
-            extensions = vscode_custom.get("extensions", [])
+            seen = set()
+            for ext in vscode_custom.get("extensions", []):
+                if ext not in seen:
+                    seen.add(ext)
+                    extensions.append(ext)
 
-    extensions = list(dict.fromkeys(extensions))
     dev_info["extensions"] = format_devcontainer_extensions(extensions)
     dev_info["file"] = os.path.relpath(file_path, os.getcwd())
     return dev_info
@@ -275,26 +508,28 @@ def parse_dockerfile(file_path: str) -> Dict[str, str]:
     base_image = ""
     exposed_ports = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line.upper().startswith("FROM"):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        base_image = parts[1]
-                elif line.upper().startswith("EXPOSE"):
-                    ports = line.split()[1:]
-                    exposed_ports.extend(ports)
+        with open(file_path, 'rb') as f:
+            # mmap refuses empty files, and there is nothing to parse anyway.
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for keyword, rest in _DOCKER_DIR_RE.findall(mm):
+                        args = rest.decode('utf-8').split()
+                        if keyword.upper() == b"FROM":
+                            if args:
+                                base_image = args[0]
+                        else:
+                            exposed_ports.extend(args)
     except Exception as e:
         print(f"Error reading Dockerfile {file_path}: {e}")
     return {"base_image": base_image, "exposed_ports": ', '.join(exposed_ports)}
 
 
-def parse_docker_compose(file_path: str) -> Dict[str, Any]:
+def parse_docker_compose(file_path: str) -> Tuple[Dict[str, Any], Set[str]]:
     data = parse_yaml_file(file_path)
     compose_info: Dict[str, Any] = {"services": []}
+    additional_dockerfiles: Set[str] = set()
     if not data or "services" not in data:
-        return compose_info
+        return compose_info, additional_dockerfiles
     for service_name, service in data["services"].items():
         image = service.get("image", "(custom)")
         ports = service.get("ports", [])
@@ -312,6 +547,10 @@ def parse_docker_compose(file_path: str) -> Dict[str, Any]:
         svc_volumes = service.get("volumes", [])
         volumes_str = format_volumes_table(svc_volumes)
         build_prop = service.get("build")
+        if isinstance(build_prop, dict) and "dockerfile" in build_prop:
+            dockerfile_path = os.path.join(
+                os.path.dirname(file_path), build_prop["dockerfile"])
+            additional_dockerfiles.add(os.path.abspath(dockerfile_path))
         compose_info["services"].append({
             "service": service_name,
             "image": image,
@@ -320,28 +559,32 @@ def parse_docker_compose(file_path: str) -> Dict[str, Any]:
             "environment": env_str,
             "build": build_prop
         })
-    return compose_info
+    return compose_info, additional_dockerfiles
 
 
 def generate_markdown_table(headers: List[str], rows: List[List[str]]) -> str:
-    md = ""
-    md += "| " + " | ".join(headers) + " |\n"
-    md += "| " + " | ".join(["---"] * len(headers)) + " |\n"
+    lines = [
+        "| " + " | ".join(headers) + " |\n",
+        "| " + " | ".join(["---"] * len(headers)) + " |\n",
+    ]
     for row in rows:
-        md += "| " + " | ".join(row) + " |\n"
-    return md
+        lines.append("| " + " | ".join(row) + " |\n")
+    return "".join(lines)
 
 
 def update_readme_table(new_section: str, readme_path: str = "README.md") -> None:
-    start_marker = "<!-- README_DEVINFO:START -->"
-    end_marker = "<!-- README_DEVINFO:END -->"
-    wrapped_section = f"{start_marker}\n{new_section}\n{end_marker}"
+    wrapped_section = f"{_README_START_MARKER}\n{new_section}\n{_README_END_MARKER}"
     if os.path.exists(readme_path):
         with open(readme_path, "r", encoding="utf-8") as f:
             content = f.read()
-        if start_marker in content and end_marker in content:
-            new_content = re.sub(f"{re.escape(start_marker)}.*?{re.escape(end_marker)}",
-                                 wrapped_section, content, flags=re.DOTALL)
+        match = _README_SECTION_RE.search(content)
+        if match:
+            # Skip the write entirely when the section is already current.
+            if match.group(0) == wrapped_section:
+                print(f"Development info in {readme_path} is already up to date")
+                return
+            new_content = _README_SECTION_RE.sub(
+                lambda _: wrapped_section, content)
         else:
             new_content = content + "\n\n" + wrapped_section
     else:
@@ -364,42 +607,34 @@ def main() -> None:
     global_spec = load_global_gitignore(base_dir)
 
     comp_file = "docker-compose.yml"
-    additional_dockerfiles = set()
-    compose_data = parse_docker_compose(comp_file)
+    compose_data, additional_dockerfiles = parse_docker_compose(comp_file)
     compose_data["file"] = os.path.relpath(comp_file, base_dir)
-    data = parse_yaml_file(comp_file)
-    if data and "services" in data:
-        for service in data["services"].values():
-            build_prop = service.get("build")
-            if isinstance(build_prop, dict) and "dockerfile" in build_prop:
-                dockerfile_path = os.path.join(
-                    os.path.dirname(comp_file), build_prop["dockerfile"])
-                additional_dockerfiles.add(os.path.abspath(dockerfile_path))
-
-    dockerfile_set = set(find_files(base_dir, r"Dockerfile", global_spec))
+
+    configs = collect_configs(base_dir, global_spec)
+    dockerfile_set = set(configs["dockerfile"])
     dockerfiles = list(dockerfile_set.union(additional_dockerfiles))
 
-    tasks_files = find_files(base_dir, r"tasks\.json", global_spec)
-    launch_files = find_files(base_dir, r"launch\.json", global_spec)
-    devcontainer_files = find_files(
-        base_dir, r"devcontainer\.json", global_spec)
+    tasks_files = configs["tasks"]
+    launch_files = configs["launch"]
+    devcontainer_files = configs["devcontainer"]
 
+    # Each file is parsed independently, so overlap the reads. map() keeps
+    # results in input order, so the generated tables stay stable.
     tasks_data = []
-    for file in tasks_files:
-        tasks_data.extend(parse_vscode_tasks(file))
     launch_data = []
-    for file in launch_files:
-        launch_data.extend(parse_vscode_launch(file))
     devcontainer_data = []
-    for file in devcontainer_files:
-        dev_info = parse_devcontainer(file)
-        if dev_info:
-            devcontainer_data.append(dev_info)
     dockerfile_data = []
-    for file in dockerfiles:
-        df_info = parse_dockerfile(file)
-        df_info["file"] = os.path.relpath(file, base_dir)
-        dockerfile_data.append(df_info)
+    with ThreadPoolExecutor() as executor:
+        for tasks in executor.map(parse_vscode_tasks, tasks_files):
+            tasks_data.extend(tasks)
+        for launch in executor.map(parse_vscode_launch, launch_files):
+            launch_data.extend(launch)
+        for dev_info in executor.map(parse_devcontainer, devcontainer_files):
+            if dev_info:
+                devcontainer_data.append(dev_info)
+        for file, df_info in zip(dockerfiles, executor.map(parse_dockerfile, dockerfiles)):
+            df_info["file"] = os.path.relpath(file, base_dir)
+            dockerfile_data.append(df_info)
 
     md_content = ""
 